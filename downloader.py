@@ -1,18 +1,53 @@
-from bs4 import BeautifulSoup
 from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import csv
 import datetime
 import enum
+import functools
+import gzip
+import io
+import json
 import logging
+import lxml.html
+from lxml import etree
 import os
-import pandas as pd
 import pickle
 import re
-import urllib
-from urllib.request import Request, urlopen
+import requests
+from requests.adapters import HTTPAdapter, Retry
+import threading
 
 
+logger = logging.getLogger("kiji")
+
 Article = namedtuple("Article", ["title", "body", "pub_date", "source", "genre"])
 Source = namedtuple("Source", ["url", "genre", "datasource"])
+SourceTask = namedtuple("SourceTask", ["url", "genre", "datasource", "download_rss", "download_articles"])
+
+# Matches Japanese publication dates like "2024年5月14日 19時30分" in one pass
+_JP_DT_RE = re.compile(r'(\d+)年(\d+)月(\d+)日[^\d]*(\d+)時(\d+)分')
+
+# Links that appear in the feeds but are not articles (channel homepages)
+_NHK_BAD_URLS = frozenset(["http://www3.nhk.or.jp/news/"])
+_ASAHI_BAD_URLS = frozenset(["https://www.asahi.com/"])
+
+# Fast-path patterns for NHK's templated article markup, avoiding a full
+# HTML tree build for the common page layout
+_NHK_TITLE_RE = re.compile(r'<h1[^>]*class="content--title"[^>]*>\s*<span[^>]*>([^<]+)</span>', re.DOTALL)
+_NHK_DATE_RE = re.compile(r'<p[^>]*class="content--date"[^>]*>\s*<time[^>]*>([^<]+)</time>', re.DOTALL)
+_NHK_SUMMARY_RE = re.compile(r'<p[^>]*class="content--summary"[^>]*>([^<]+)</p>', re.DOTALL)
+
+# lxml parsers are not thread-safe, so each worker thread reuses its own
+# configured instance instead of building a default parser per page
+_tls = threading.local()
+
+
+def _html_parser():
+    parser = getattr(_tls, 'html_parser', None)
+    if parser is None:
+        parser = lxml.html.HTMLParser(collect_ids=False, no_network=True)
+        _tls.html_parser = parser
+    return parser
 
 
 class Genre(enum.Enum):
@@ -64,6 +99,23 @@ class KijiDownloader:
             'Accept-Encoding': 'none',
             'Accept-Language': 'en-US,en;q=0.8',
             'Connection': 'keep-alive'}
+        # A single pooled session so TCP/TLS connections are reused across
+        # the hundreds of requests made to the same few hosts
+        self.session = requests.Session()
+        self.session.headers.update(self.hdr)
+        # Bounded retries with exponential backoff on transient gateway
+        # errors, so one flaky response does not fail a whole source
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(['GET'])
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # (connect, read) timeouts cap how long one slow host can stall a worker
+        self.timeout = (3, 10)
         # The dictionary function mappings for the various data sources
         self.download_rss = {
             DataSource.NHK: self.download_rss_nhk,
@@ -73,15 +125,46 @@ class KijiDownloader:
             DataSource.NHK: self.download_articles_nhk,
             DataSource.Asahi: self.download_articles_asahi
         }
+        # Each source pre-bundles its parser functions, so download_source
+        # pays no datasource dict dispatch per call
+        self.source_tasks = [
+            SourceTask(
+                source.url,
+                source.genre,
+                source.datasource,
+                self.download_rss[source.datasource],
+                self.download_articles[source.datasource],
+            )
+            for source in self.sources
+        ]
+        # Precompiled XPath expressions for the article fields of each data
+        # source, so per-page parsing is a single lxml tree build plus a few
+        # compiled lookups
+        self.xp_nhk_title = etree.XPath('//h1[@class="content--title"]/span/text()')
+        self.xp_nhk_date = etree.XPath('//p[@class="content--date"]/time/text()')
+        self.xp_nhk_summary = etree.XPath('//p[@class="content--summary"]//text()')
+        self.xp_nhk_body = etree.XPath('//div[@class="maincontent_body text"]//p//text()')
+        self.xp_asahi_title = etree.XPath('(//h1)[last()]/text()')
+        self.xp_asahi_date = etree.XPath('//time/text()')
+        self.xp_asahi_body = etree.XPath('//div[@class="nfyQp"]//p//text()')
         self.dir_path = os.path.dirname(os.path.realpath(__file__))
         self.previously_processed_urls = defaultdict(defaultdict(list).copy)
         self.ppu_file = os.path.join(self.dir_path, "data", "prev_processed_urls.pkl")
+        # Conditional-request cache per feed URL: validators from the last
+        # response plus the article URLs parsed out of it
+        self.feed_cache = {}
+        self.feed_cache_file = os.path.join(self.dir_path, "data", "feed_cache.json")
 
     def open_previously_processed_urls(self):
         if os.path.isfile(self.ppu_file):
             with open(self.ppu_file, 'rb') as f:
                 self.previously_processed_urls = pickle.load(f)
 
+    def open_feed_cache(self):
+        if os.path.isfile(self.feed_cache_file):
+            with open(self.feed_cache_file) as f:
+                self.feed_cache = json.load(f)
+
     def download(self, output_dir=os.getcwd()):
         """Download and save the articles from sources.
 
@@ -89,59 +172,71 @@ class KijiDownloader:
         """
         self.start_logger()
 
-        # Load in previously handled urls
+        # Load in previously handled urls and cached feed state
         self.open_previously_processed_urls()
+        self.open_feed_cache()
 
-        # Download and parse the articles
+        # Download and parse the articles. Each source is pure I/O-bound work,
+        # so the fetches are overlapped across a thread pool instead of paying
+        # every round trip serially.
         articles = []
-        for source in self.sources:
-            new_articles = self.download_source(source)
-            articles.extend(new_articles)
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [executor.submit(self.download_source, source) for source in self.source_tasks]
+            for future in as_completed(futures):
+                articles.extend(future.result())
 
-        # Create a dataframe containing the parsed articles, and save to CSV
+        # Save the parsed articles to gzipped CSV - Japanese UTF-8 text
+        # compresses several-fold, cutting disk and transfer cost
         dt = datetime.datetime.now().strftime("%Y_%m_%d__%H_%M_%S")
-        filename = os.path.join(self.dir_path, output_dir, f"japan_articles_{dt}.csv")
-        article_df = pd.DataFrame(articles, columns=Article._fields)
-        article_df.to_csv(filename, index=False)
-        logging.info("Finished downloading")
-
-        # Save new previously processed URLs
+        filename = os.path.join(self.dir_path, output_dir, f"japan_articles_{dt}.csv.gz")
+        with gzip.open(filename, 'wt', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(Article._fields)
+            writer.writerows(articles)
+        logger.info("Finished downloading")
+
+        # Save new previously processed URLs and feed cache state
         with open(self.ppu_file, 'wb') as f:
             pickle.dump(self.previously_processed_urls, f)
+        with open(self.feed_cache_file, 'w') as f:
+            json.dump(self.feed_cache, f)
+
+        self.session.close()
 
     def start_logger(self):
         """Initiate the logger.
 
         :return N/A:
         """
+        # Configure handlers once per process, not per instance
+        if logger.handlers:
+            return
         current_ts = datetime.datetime.now().strftime("%Y_%m_%d__%H_%M_%S")
         if not os.path.exists(os.path.join(self.dir_path, "logs")):
             os.makedirs(os.path.join(self.dir_path, "logs"))
         file_name = os.path.join(self.dir_path, "logs", f"KijiDownloader{current_ts}.log")
 
-        logging.basicConfig(
-            filename=file_name,
-            filemode='a',
-            format='%(asctime)s - %(message)s',
-            level=logging.DEBUG
-        )
-        logging.info("Logging initiated for KijiDownloader.")
+        handler = logging.FileHandler(file_name, mode='a')
+        handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        logger.info("Logging initiated for KijiDownloader.")
 
-    def download_source(self, source: Source):
+    def download_source(self, source: SourceTask):
         """Retrieves all News Articles for the specified News Source URLs. Using
         the provided URL, Genre, and Source, a list of new News Articles is retrieved.
 
-        :param source: A namedtuple that contains the URL, genre, and data source.
+        :param source: A namedtuple that contains the URL, genre, data source,
+            and the pre-bound parser functions for that data source.
         :return articles:list[Articles]: A list containing the parsed articles.
         """
-        # Get information from the provided Source
+        # Get information from the provided SourceTask
         url, genre, datasource = source.url, source.genre, source.datasource
-        logging.info(f"Downloading {genre.name} from {datasource.name}")
+        logger.info("Downloading %s from %s", genre.name, datasource.name)
 
         # Get the article URLs for the specified URL of the datasource
-        download_rss = self.download_rss[datasource]
-        article_urls = download_rss(url)
-        logging.info(f"\tDownloading {len(article_urls)} {genre.name} articles from {datasource.name}")
+        article_urls = source.download_rss(url)
+        logger.info("\tDownloading %d %s articles from %s", len(article_urls), genre.name, datasource.name)
 
         # Filter out URLs that we have already processed
         filtered_article_urls = [
@@ -150,34 +245,97 @@ class KijiDownloader:
         ]
         num_new_articles = len(filtered_article_urls)
         num_old_articles = len(article_urls) - len(filtered_article_urls)
-        logging.info(f"\t{num_old_articles} of articles already processed. Processing {num_new_articles} articles")
-
-        # Parse the article html and create an Article object for saving
-        download_articles = self.download_articles[datasource]
+        logger.info("\t%d of articles already processed. Processing %d articles", num_old_articles, num_new_articles)
+
+        # Parse the article html and create an Article object for saving.
+        # Article fetches within a source are likewise overlapped, with the
+        # pool size bounding how many requests hit a host at once.
+        download_articles = source.download_articles
+        # The enum values are loop-invariant, so look them up once instead of
+        # going through the Enum descriptor protocol per article. Plain tuples
+        # are enough for the CSV-writing path; Article still supplies the
+        # column names.
+        ds_val, g_val = datasource.value, genre.value
         articles = []
-        for au in filtered_article_urls:
-            try:
-                title, date_time, body = download_articles(au)
-                article = Article(
-                    title,
-                    body,
-                    date_time,
-                    datasource.value,
-                    genre.value
-                )
-                articles.append(article)
-            except urllib.request.URLError as e:
-                message = f"URLError with url={au}. {e}"
-                logging.warning(message)
-
-        logging.info(f"\tDownloaded {len(articles)} {genre.name} articles from {datasource.name}")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(download_articles, au): au
+                for au in filtered_article_urls
+            }
+            for future in as_completed(futures):
+                au = futures[future]
+                try:
+                    title, date_time, body = future.result()
+                    articles.append((title, body, date_time, ds_val, g_val))
+                except requests.RequestException as e:
+                    logger.warning("RequestException with url=%s. %s", au, e)
+
+        logger.info("\tDownloaded %d %s articles from %s", len(articles), genre.name, datasource.name)
 
         # Update Previously processed urls
         self.previously_processed_urls[datasource][genre] = article_urls
-        logging.info(f"\tUpdated previously processed URLs for {datasource.name}.{genre.name}")
+        logger.info("\tUpdated previously processed URLs for %s.%s", datasource.name, genre.name)
 
         return articles
 
+    def _fetch_feed(self, url: str, exclude):
+        """Fetch an RSS feed, revalidating against the cached copy.
+
+        Sends the ETag/Last-Modified validators from the previous run so an
+        unchanged feed comes back as a 304 with no body to download or parse.
+
+        :param url: The RSS feed URL
+        :param exclude: URLs to leave out of the parsed result
+        :return article_urls:list[str]: The article URLs listed on the feed
+        """
+        headers = {}
+        cached = self.feed_cache.get(url)
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        response = self.session.get(url, timeout=self.timeout, headers=headers)
+        if response.status_code == 304:
+            logger.info("Feed unchanged since last run, using cached URLs for %s", url)
+            return cached['article_urls']
+        response.raise_for_status()
+
+        article_urls = self._parse_rss_links(response.content, exclude)
+        self.feed_cache[url] = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'article_urls': article_urls,
+        }
+        return article_urls
+
+    def _parse_rss_links(self, xml_bytes: bytes, exclude):
+        """Stream the link elements out of an RSS/RDF/Atom feed.
+
+        :param xml_bytes: The raw bytes of the feed
+        :param exclude: URLs to leave out (e.g. the channel's own homepage)
+        :return article_urls:list[str]: A list containing the URLs for all
+            of the articles listed on the feed.
+        """
+        article_urls = []
+        context = etree.iterparse(
+            io.BytesIO(xml_bytes),
+            events=('end',),
+            tag=(
+                'link',
+                '{http://purl.org/rss/1.0/}link',
+                '{http://www.w3.org/2005/Atom}link',
+            )
+        )
+        for _, elem in context:
+            # Atom carries the URL in the href attribute, RSS/RDF in the text
+            link = elem.text or elem.get('href')
+            if link and link not in exclude:
+                article_urls.append(link)
+            elem.clear()
+        return article_urls
+
     def download_rss_nhk(self, url: str):
         """Parse one of the RSS feeds for NHK News, returning article URLs.
 
@@ -186,22 +344,13 @@ class KijiDownloader:
             of the articles listed on the RSS feed.
         """
         article_urls = []
-        bad_urls = ["http://www3.nhk.or.jp/news/"]
-        # Grab html of the RSS feed, extracting the article URLs
+        # Grab the RSS feed, extracting the article URLs
         try:
-            request = Request(url, None, headers=self.hdr)
-            page_text = str(urlopen(request).read(), 'UTF-8')
-            pattern = r'<link>(.*)</link>'
-            article_urls = re.findall(pattern, page_text)
-            # Seems to have a few links we don't want to include
-            for bu in bad_urls:
-                if bu in article_urls:
-                    article_urls.remove(bu)
-        except urllib.error.HTTPError as e:
-            logging.warning(e)
+            article_urls = self._fetch_feed(url, _NHK_BAD_URLS)
+        except requests.HTTPError as e:
+            logger.warning(e)
         except Exception as e:
-            message = f"Unhandled exception with url={url}: {e}"
-            logging.warning(message)
+            logger.warning("Unhandled exception with url=%s: %s", url, e)
         return article_urls
 
     def download_rss_asahi(self, url: str):
@@ -212,22 +361,13 @@ class KijiDownloader:
             of the articles listed on the RSS feed.
         """
         article_urls = []
-        bad_urls = ["https://www.asahi.com/"]
-        # Grab html of the RSS feed, extracting the article URLs
+        # Grab the RSS feed, extracting the article URLs
         try:
-            request = Request(url, None, headers=self.hdr)
-            page_text = str(urlopen(request).read(), 'UTF-8')
-            pattern = r'<link>(.*)</link>'
-            article_urls = re.findall(pattern, page_text)
-            # Seems to have a few links we don't want to include
-            for bu in bad_urls:
-                if bu in article_urls:
-                    article_urls.remove(bu)
-        except urllib.error.HTTPError as e:
-            logging.warning(e)
+            article_urls = self._fetch_feed(url, _ASAHI_BAD_URLS)
+        except requests.HTTPError as e:
+            logger.warning(e)
         except Exception as e:
-            message = f"Unhandled exception with url={url}: {e}"
-            logging.warning(message)
+            logger.warning("Unhandled exception with url=%s: %s", url, e)
         return article_urls
 
     def download_articles_asahi(self, url: str):
@@ -238,44 +378,39 @@ class KijiDownloader:
         :return date_text:str: The article date
         :return body_text:str: The article body
         """
-        request = Request(url, None, headers=self.hdr)
-        page_text = str(urlopen(request).read(), 'UTF-8')
-        page = BeautifulSoup(page_text, "lxml")
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        tree = lxml.html.fromstring(response.text, parser=_html_parser())
 
-        # Get Title - There could be multiple h1 tags, but title should be the last h1 tag
+        # Get Title - There could be multiple h1 tags, but title should be the
+        # last h1 tag. Taking only the direct text() nodes skips any span
+        # (e.g. photo credits) nested inside the tag.
         title_text = ""
-        try:
-            h1_tags = page.find_all('h1')
-            h1_tag = h1_tags[-1]
-            # Check if there is a span in this tag, and remove it if it exists
-            if h1_tag.find('span'):
-                span_tag = h1_tag.find('span')
-                span_tag.decompose()
-            # The remaining text in the h1 tag should be the title
-            title_text = h1_tag.text
-        except AttributeError as e:
-            message = f"Unable to parse title for URL={url}"
-            logging.warning(message)
+        title_parts = self.xp_asahi_title(tree)
+        if title_parts:
+            title_text = "".join(title_parts)
+        else:
+            logger.warning("Unable to parse title for URL=%s", url)
 
         # Get Date - The date is within a time tag
         date_text = ""
-        try:
-            date_text = page.find('time').text
-            date_text = self.jp_date_to_yyyymmdd(date_text)
-        except AttributeError as e:
-            message = f"Unable to parse date for URL={url}"
-            logging.warning(message)
+        date_parts = self.xp_asahi_date(tree)
+        if date_parts:
+            date_text = self.jp_date_to_yyyymmdd(date_parts[0])
+            if date_text is None:
+                # Default to now (should be within 1 day of actual publication)
+                logger.warning("Unable to parse dt=%s", date_parts[0])
+                date_text = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        else:
+            logger.warning("Unable to parse date for URL=%s", url)
 
         # Body Text - Appears to be in <p> tags, inside <div class="nfyQp">
         body_text = ""
-        try:
-            div_tag = page.find('div', {'class': 'nfyQp'})
-            p_tags = div_tag.find_all('p')
-            for p_tag in p_tags:
-                body_text += p_tag.text
-        except AttributeError as e:
-            message = f"Unable to parse body for URL={url}"
-            logging.warning(message)
+        body_parts = self.xp_asahi_body(tree)
+        if body_parts:
+            body_text = "".join(body_parts)
+        else:
+            logger.warning("Unable to parse body for URL=%s", url)
 
         return title_text, date_text, body_text
 
@@ -287,88 +422,81 @@ class KijiDownloader:
         :return date_text:str: The article date
         :return body_text:str: The article body
         """
-        request = Request(url, None, headers=self.hdr)
-        page_text = str(urlopen(request).read(), 'UTF-8')
-        page = BeautifulSoup(page_text, "lxml")
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        page_text = response.text
+        # NHK pages are templated, so the fields can usually be pulled with
+        # compiled regexes on the raw text; the lxml tree is built lazily,
+        # only for pages where a fast path misses
+        tree = None
 
         # Get Title - The title is within a span tag, inside <h1 class="content--title">
         title_text = ""
-        try:
-            h1_tag = page.find('h1', {'class': 'content--title'})
-            title_text = h1_tag.find('span').text
-        except AttributeError as e:
-            message = f"Unable to parse title for URL={url}"
-            logging.warning(message)
+        match = _NHK_TITLE_RE.search(page_text)
+        if match:
+            title_text = match.group(1)
+        else:
+            tree = lxml.html.fromstring(page_text, parser=_html_parser())
+            title_text = "".join(self.xp_nhk_title(tree))
+            if not title_text:
+                logger.warning("Unable to parse title for URL=%s", url)
 
         # Get Date - The date is within a time tag, inside <p clas="content--date">
         date_text = ""
-        try:
-            date_tag = page.find('p', {'class': 'content--date'})
-            date_text = date_tag.find('time').text
-            date_text = self.jp_date_to_yyyymmdd(date_text)
-        except AttributeError as e:
-            message = f"Unable to parse date for URL={url}"
-            logging.warning(message)
+        match = _NHK_DATE_RE.search(page_text)
+        if match:
+            raw_date = match.group(1)
+        else:
+            if tree is None:
+                tree = lxml.html.fromstring(page_text, parser=_html_parser())
+            date_parts = self.xp_nhk_date(tree)
+            raw_date = date_parts[0] if date_parts else None
+        if raw_date:
+            date_text = self.jp_date_to_yyyymmdd(raw_date)
+            if date_text is None:
+                # Default to now (should be within 1 day of actual publication)
+                logger.warning("Unable to parse dt=%s", raw_date)
+                date_text = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        else:
+            logger.warning("Unable to parse date for URL=%s", url)
 
         # Content can be stored in a few different ways
+        # <p class="content--summary" style> or
+        # <div class="maincontent_body text"><p></div>
         body_text = ""
-        try:
-            # <p class="content--sumary" style>
-            if page.find('p', {'class': 'content--summary'}):
-                body_tag = page.find('p', {'class': 'content--summary'})
-                body_text += body_tag.text
-            # <div class="maincontent_body text"><p></div>
+        match = _NHK_SUMMARY_RE.search(page_text)
+        if match:
+            body_text = match.group(1)
+        else:
+            if tree is None:
+                tree = lxml.html.fromstring(page_text, parser=_html_parser())
+            body_parts = self.xp_nhk_summary(tree) or self.xp_nhk_body(tree)
+            if body_parts:
+                body_text = "".join(body_parts)
             else:
-                body_tag = page.find('div', {'class': 'maincontent_body text'})
-                p_tags = body_tag.find_all('p')
-                for p_tag in p_tags:
-                    body_text += p_tag.text
-        except AttributeError as e:
-            message = f"Unable to parse body for URL={url}"
-            logging.warning(message)
+                logger.warning("Unable to parse body for URL=%s", url)
 
         return title_text, date_text, body_text
 
-    def jp_date_to_yyyymmdd(self, dt: str):
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def jp_date_to_yyyymmdd(dt: str):
         """Parse the provided Japanese date into a numeric format.
 
+        Articles published in the same batch share the same date string, so
+        results are cached and repeat inputs become a dict lookup.
+
         :param dt: The datetime string to be parsed
-        :return dt_text:str: The parsed datetime string
+        :return dt_text:str: The parsed datetime string, or None if the
+            string could not be parsed
         """
-        # Each of the regex used to grab each portion of the datetime
-        year_pattern = r'(\d*)年'
-        month_pattern = r'(\d*)月'
-        day_pattern = r'(\d*)日'
-        hour_pattern = r'(\d*)時'
-        minute_pattern = r'(\d*)分'
-
-        # Default datetime string to now (should be within 1 day of actual publication)
-        dt_text = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        # Try to extract the datetime elements from string
-        try:
-            yyyy = int(re.findall(year_pattern, dt)[0])
-            mm = int(re.findall(month_pattern, dt)[0])
-            dd = int(re.findall(day_pattern, dt)[0])
-            hour = int(re.findall(hour_pattern, dt)[0])
-            minute = int(re.findall(minute_pattern, dt)[0])
-
-            formatted_dt = datetime.datetime(
-                yyyy,
-                mm,
-                dd,
-                hour,
-                minute
-            )
-            dt_text = formatted_dt.strftime("%Y-%m-%d %H:%M:%S")
-        except TypeError as e:
-            message = f"Unable to parse dt={dt}"
-            logging.warning(message)
-        except IndexError as e:
-            message = f"Unable to parse dt={dt}"
-            logging.warning(message)
-
-        return dt_text
+        # All five datetime fields come out of a single precompiled pass
+        match = _JP_DT_RE.search(dt)
+        if match:
+            yyyy, mm, dd, hour, minute = map(int, match.groups())
+            formatted_dt = datetime.datetime(yyyy, mm, dd, hour, minute)
+            return formatted_dt.strftime("%Y-%m-%d %H:%M:%S")
+        return None
 
 
 def main():